@@ -8,6 +8,7 @@ import psycopg2
 import random
 from datetime import datetime, timezone
 import uuid
+from workout_writer import DirectInsertWriter, PreparedInsertWriter, DEFAULT_PIPELINE_DEPTH
 
 # Database connection
 DB_CONFIG = {
@@ -18,6 +19,20 @@ DB_CONFIG = {
     'password': 'rythm_password'
 }
 
+# Writer configuration: the prepared writer batches INSERTs for databases
+# where per-row round trips are slow and COPY is not available
+USE_PREPARED_WRITER = False
+PIPELINE_DEPTH = DEFAULT_PIPELINE_DEPTH
+
+SESSION_COLUMNS = [
+    'session_id', 'tenant_id', 'user_id', 'name', 'category', 'notes',
+    'started_at', 'training_load', 'perceived_exertion', 'duration_seconds'
+]
+SET_COLUMNS = [
+    'tenant_id', 'session_id', 'exercise_id', 'set_index',
+    'value_1_type', 'value_1_numeric', 'value_2_type', 'value_2_numeric'
+]
+
 USER_ID = 'e8d9e60d-aa7a-4066-984f-53371b902c68'
 TENANT_ID = '9386cbbf-24eb-4593-a2e2-b94b9578caba'
 TODAY = '2025-09-11'
@@ -33,9 +48,19 @@ def get_exercises(conn):
     """)
     return cursor.fetchall()
 
+def create_workout_writer(conn):
+    """Create the configured row writer and register the session/set INSERTs"""
+    if USE_PREPARED_WRITER:
+        writer = PreparedInsertWriter(conn, depth=PIPELINE_DEPTH)
+    else:
+        writer = DirectInsertWriter(conn)
+    writer.prepare('insert_session', 'sessions', SESSION_COLUMNS)
+    writer.prepare('insert_set', 'sets', SET_COLUMNS)
+    return writer
+
 def create_todays_workouts(conn):
     """Create 2 workouts for today"""
-    cursor = conn.cursor()
+    writer = create_workout_writer(conn)
     
     # Get exercises
     exercises = get_exercises(conn)
@@ -51,11 +76,7 @@ def create_todays_workouts(conn):
     workout1_time = f"{TODAY} 08:30:00+00"  # 8:30 AM
     
     session1_id = str(uuid.uuid4())
-    cursor.execute("""
-        INSERT INTO sessions (session_id, tenant_id, user_id, name, category, notes, started_at, training_load, perceived_exertion, duration_seconds)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING session_id
-    """, (
+    writer.add('insert_session', (
         session1_id, TENANT_ID, USER_ID,
         "Morning Strength Training",
         "strength",
@@ -78,17 +99,11 @@ def create_todays_workouts(conn):
             if val1_type == 'weight' and val2_type == 'reps':
                 weight = random.randint(60, 140)  # kg
                 reps = random.randint(5, 12)
-                cursor.execute("""
-                    INSERT INTO sets (tenant_id, session_id, exercise_id, set_index, value_1_type, value_1_numeric, value_2_type, value_2_numeric)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (TENANT_ID, session1_id, ex_id, set_num + 1, 'weight', weight, 'reps', reps))
+                writer.add('insert_set', (TENANT_ID, session1_id, ex_id, set_num + 1, 'weight', weight, 'reps', reps))
                 print(f"    Set {set_num + 1}: {weight}kg × {reps} reps")
             elif val1_type == 'reps':
                 reps = random.randint(8, 25)
-                cursor.execute("""
-                    INSERT INTO sets (tenant_id, session_id, exercise_id, set_index, value_1_type, value_1_numeric)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (TENANT_ID, session1_id, ex_id, set_num + 1, 'reps', reps))
+                writer.add('insert_set', (TENANT_ID, session1_id, ex_id, set_num + 1, 'reps', reps, None, None))
                 print(f"    Set {set_num + 1}: {reps} reps")
     
     # Workout 2: Evening Cardio + Hybrid Session
@@ -96,11 +111,7 @@ def create_todays_workouts(conn):
     workout2_time = f"{TODAY} 18:45:00+00"  # 6:45 PM
     
     session2_id = str(uuid.uuid4())
-    cursor.execute("""
-        INSERT INTO sessions (session_id, tenant_id, user_id, name, category, notes, started_at, training_load, perceived_exertion, duration_seconds)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING session_id
-    """, (
+    writer.add('insert_session', (
         session2_id, TENANT_ID, USER_ID,
         "Evening Hybrid Training",
         "hybrid",
@@ -123,17 +134,11 @@ def create_todays_workouts(conn):
                 if val1_type == 'distance' and val2_type == 'time':
                     distance = random.randint(800, 2000)  # meters
                     time_seconds = random.randint(180, 480)  # 3-8 minutes
-                    cursor.execute("""
-                        INSERT INTO sets (tenant_id, session_id, exercise_id, set_index, value_1_type, value_1_numeric, value_2_type, value_2_numeric)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (TENANT_ID, session2_id, ex_id, set_num + 1, 'distance', distance, 'time', time_seconds))
+                    writer.add('insert_set', (TENANT_ID, session2_id, ex_id, set_num + 1, 'distance', distance, 'time', time_seconds))
                     print(f"    Set {set_num + 1}: {distance}m in {time_seconds}s")
                 elif val1_type == 'time':
                     time_seconds = random.randint(300, 1200)  # 5-20 minutes
-                    cursor.execute("""
-                        INSERT INTO sets (tenant_id, session_id, exercise_id, set_index, value_1_type, value_1_numeric)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    """, (TENANT_ID, session2_id, ex_id, set_num + 1, 'time', time_seconds))
+                    writer.add('insert_set', (TENANT_ID, session2_id, ex_id, set_num + 1, 'time', time_seconds, None, None))
                     print(f"    Set {set_num + 1}: {time_seconds}s duration")
         else:  # strength exercise
             num_sets = random.randint(3, 4)
@@ -143,12 +148,12 @@ def create_todays_workouts(conn):
                 if val1_type == 'weight' and val2_type == 'reps':
                     weight = random.randint(70, 120)  # kg
                     reps = random.randint(6, 15)
-                    cursor.execute("""
-                        INSERT INTO sets (tenant_id, session_id, exercise_id, set_index, value_1_type, value_1_numeric, value_2_type, value_2_numeric)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (TENANT_ID, session2_id, ex_id, set_num + 1, 'weight', weight, 'reps', reps))
+                    writer.add('insert_set', (TENANT_ID, session2_id, ex_id, set_num + 1, 'weight', weight, 'reps', reps))
                     print(f"    Set {set_num + 1}: {weight}kg × {reps} reps")
     
+    # Send any batched rows before the caller commits
+    writer.flush()
+    
     workouts.extend([session1_id, session2_id])
     return workouts
 
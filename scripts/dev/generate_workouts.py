@@ -9,6 +9,7 @@ import json
 import psycopg2
 from datetime import datetime, timedelta
 from uuid import uuid4
+from workout_writer import DirectInsertWriter, PreparedInsertWriter, DEFAULT_PIPELINE_DEPTH
 
 # Database configuration
 DB_CONFIG = {
@@ -19,6 +20,20 @@ DB_CONFIG = {
     'password': 'password'
 }
 
+# Writer configuration: the prepared writer batches INSERTs for databases
+# where per-row round trips are slow and COPY is not available
+USE_PREPARED_WRITER = False
+PIPELINE_DEPTH = DEFAULT_PIPELINE_DEPTH
+
+SESSION_COLUMNS = [
+    'session_id', 'user_id', 'tenant_id', 'category', 'notes',
+    'started_at', 'completed_at', 'training_load', 'perceived_exertion'
+]
+SET_COLUMNS = [
+    'set_id', 'session_id', 'exercise_id', 'tenant_id', 'set_index',
+    'value_1_type', 'value_1_numeric', 'value_2_type', 'value_2_numeric'
+]
+
 # User configuration
 USER_ID = 'e8d9e60d-aa7a-4066-984f-53371b902c68'
 TENANT_ID = '9386cbbf-24eb-4593-a2e2-b94b9578caba'
@@ -282,10 +297,18 @@ def generate_cardio_values(exercise):
     
     return values
 
-def create_workout_session(conn, workout_num, workout_date, category, exercises):
+def create_workout_writer(conn):
+    """Create the configured row writer and register the session/set INSERTs"""
+    if USE_PREPARED_WRITER:
+        writer = PreparedInsertWriter(conn, depth=PIPELINE_DEPTH)
+    else:
+        writer = DirectInsertWriter(conn)
+    writer.prepare('insert_session', 'sessions', SESSION_COLUMNS)
+    writer.prepare('insert_set', 'sets', SET_COLUMNS)
+    return writer
+
+def create_workout_session(writer, workout_num, workout_date, category, exercises):
     """Create a workout session in the database"""
-    cursor = conn.cursor()
-    
     # Generate session data
     session_id = str(uuid4())
     training_load = random.randint(TRAINING_LOAD_RANGE[0], TRAINING_LOAD_RANGE[1])
@@ -294,12 +317,7 @@ def create_workout_session(conn, workout_num, workout_date, category, exercises)
     workout_note = random.choice(WORKOUT_NOTES)
     
     # Create session
-    cursor.execute("""
-        INSERT INTO sessions (
-            session_id, user_id, tenant_id, category, notes, 
-            started_at, completed_at, training_load, perceived_exertion
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """, (
+    writer.add('insert_session', (
         session_id,
         USER_ID,
         TENANT_ID,
@@ -323,12 +341,7 @@ def create_workout_session(conn, workout_num, workout_date, category, exercises)
                 weight = generate_weight_for_exercise(exercise['name'], exercise['exercise_type'])
                 reps = generate_reps_for_exercise(exercise['name'], exercise['exercise_type'])
                 
-                cursor.execute("""
-                    INSERT INTO sets (
-                        set_id, session_id, exercise_id, tenant_id, set_index,
-                        value_1_type, value_1_numeric, value_2_type, value_2_numeric
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+                writer.add('insert_set', (
                     set_id, session_id, exercise['exercise_id'], TENANT_ID, set_num + 1,  # set_index starts from 1
                     'weight_kg', weight, 'reps', reps
                 ))
@@ -337,12 +350,7 @@ def create_workout_session(conn, workout_num, workout_date, category, exercises)
                 # Cardio exercise
                 cardio_values = generate_cardio_values(exercise)
                 
-                cursor.execute("""
-                    INSERT INTO sets (
-                        set_id, session_id, exercise_id, tenant_id, set_index,
-                        value_1_type, value_1_numeric, value_2_type, value_2_numeric
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
+                writer.add('insert_set', (
                     set_id, session_id, exercise['exercise_id'], TENANT_ID, set_num + 1,  # set_index starts from 1
                     cardio_values.get('value_1_type'), cardio_values.get('value_1_numeric'),
                     cardio_values.get('value_2_type'), cardio_values.get('value_2_numeric')
@@ -373,6 +381,8 @@ def main():
         print(f"💪 Loaded {len(strength_exercises)} strength exercises")
         print(f"🏃 Loaded {len(cardio_exercises)} cardio exercises")
         
+        writer = create_workout_writer(conn)
+        
         # Workout categories and their distribution
         workout_categories = ['strength', 'cardio', 'hybrid']
         category_weights = [0.31, 0.36, 0.33]  # From the specification
@@ -408,13 +418,14 @@ def main():
                     workout_exercises.extend(random.sample(cardio_exercises, min(cardio_count, len(cardio_exercises))))
             
             # Create the workout
-            workout = create_workout_session(conn, i+1, workout_date, category, workout_exercises)
+            workout = create_workout_session(writer, i+1, workout_date, category, workout_exercises)
             generated_workouts.append(workout)
             
             if (i + 1) % 10 == 0:
                 print(f"⚡ Generated {i+1}/{TOTAL_WORKOUTS} workouts...")
         
-        # Commit all changes
+        # Send any batched rows, then commit all changes
+        writer.flush()
         conn.commit()
         print("✅ All workouts committed to database!")
         
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Row writers shared by the workout generation scripts.
+
+DirectInsertWriter issues one INSERT per row (one network round trip each).
+PreparedInsertWriter prepares each INSERT once on the server and sends the
+queued EXECUTEs in batches, so throughput no longer depends on round-trip
+latency. It only needs plain INSERT privileges, which makes it usable on
+databases where COPY FROM STDIN is restricted for the rythm_api role.
+"""
+
+DEFAULT_PIPELINE_DEPTH = 100
+
+
+class DirectInsertWriter:
+    """Write each row with its own INSERT statement"""
+
+    def __init__(self, conn):
+        self.cursor = conn.cursor()
+        self.statements = {}
+
+    def prepare(self, name, table, columns):
+        """Register an INSERT statement for table/columns under name"""
+        placeholders = ', '.join(['%s'] * len(columns))
+        self.statements[name] = (
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
+
+    def add(self, name, values):
+        """Insert a single row immediately"""
+        self.cursor.execute(self.statements[name], values)
+
+    def flush(self):
+        """Nothing is buffered, so there is nothing to send"""
+        pass
+
+
+class PreparedInsertWriter:
+    """Prepare INSERTs once and send queued executions in batches of `depth`"""
+
+    def __init__(self, conn, depth=DEFAULT_PIPELINE_DEPTH):
+        if depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1, got {depth}")
+        self.cursor = conn.cursor()
+        self.depth = depth
+        self.statements = {}
+        self.pending = []
+
+    def prepare(self, name, table, columns):
+        """Create a server-side prepared INSERT for table/columns under name"""
+        params = ', '.join(f"${i + 1}" for i in range(len(columns)))
+        self.cursor.execute(
+            f"PREPARE {name} AS INSERT INTO {table} ({', '.join(columns)}) VALUES ({params})"
+        )
+        placeholders = ', '.join(['%s'] * len(columns))
+        self.statements[name] = f"EXECUTE {name} ({placeholders})"
+
+    def add(self, name, values):
+        """Queue a row, sending the batch once `depth` rows are pending"""
+        # Rows are sent in the order they were added, so a session is always
+        # inserted before the sets that reference it.
+        self.pending.append(self.cursor.mogrify(self.statements[name], values))
+        if len(self.pending) >= self.depth:
+            self.flush()
+
+    def flush(self):
+        """Send all queued executions in a single round trip"""
+        if not self.pending:
+            return
+        self.cursor.execute(b';'.join(self.pending))
+        self.pending = []